@@ -47,8 +47,8 @@ def setup_logger():
         )
     )
 
-    # File handler (no color)
-    fh = logging.FileHandler("bot.log", encoding="utf-8", mode="w")
+    # File handler (no color), opened on the first record rather than at import
+    fh = logging.FileHandler("bot.log", encoding="utf-8", mode="w", delay=True)
     fh.setLevel(logging.INFO)
     fh.setFormatter(
         logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
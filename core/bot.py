@@ -5,7 +5,8 @@ import sys
 import logging
 from core import logger
 from core.config import config
-from core.commands import load_commands
+from core.startup import startup_timer
+from core.commands import load_commands, sync_commands
 
 
 class DiscordBot:
@@ -30,9 +31,13 @@ class DiscordBot:
 
         # Set up events
         self.bot.event(self.on_ready)
+        startup_timer.mark("config")
 
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
+        if not startup_timer.reported:
+            startup_timer.mark("gateway")
+            startup_timer.report()
         logger.info(f"Logged in as {self.bot.user} (ID: {self.bot.user.id})")
         logger.info(
             f"Bot active in {len(self.bot.guilds)} guild(s): "
@@ -40,18 +45,12 @@ class DiscordBot:
         )
 
         # Sync commands with the specified guilds
-        try:
-            for gid in self.guild_ids:
-                guild = discord.Object(id=gid)
-                self.bot.tree.copy_global_to(guild=guild)
-                synced = await self.bot.tree.sync(guild=guild)
-                logger.info(f"Synced {len(synced)} command(s) to guild ID: {gid}")
-        except Exception as e:
-            logger.error(f"Failed to sync commands: {e}")
+        await sync_commands(self.bot)
 
     async def setup(self):
         """Set up the bot by loading commands."""
         await load_commands(self.bot)
+        startup_timer.mark("load_commands")
 
     def run(self):
         """Run the bot and ensure Discord.py uses our logger."""
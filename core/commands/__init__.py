@@ -1,24 +1,84 @@
 import os
-import importlib
+import asyncio
+import json
+import discord
+from typing import List
 from discord.ext import commands
 
 from core import logger  # Use your new generic logger import
+from core.config import config
 
+COMMANDS_PACKAGE = "core.commands"
+COMMANDS_DIR = os.path.dirname(__file__)
 
-async def load_commands(bot: commands.Bot):
-    """Dynamically load all command modules from the commands directory."""
-    current_dir = os.path.dirname(__file__)
-    command_modules = [
+# Held while modules are reloaded. It lives here rather than in a command
+# module so that reloading the module holding it does not replace it.
+reload_lock = asyncio.Lock()
+
+
+def get_command_modules() -> List[str]:
+    """List the command module names found in the commands directory."""
+    return sorted(
         filename[:-3]
-        for filename in os.listdir(current_dir)
+        for filename in os.listdir(COMMANDS_DIR)
         if filename.endswith(".py") and filename != "__init__.py"
-    ]
+    )
+
 
-    for module_name in command_modules:
+async def load_commands(bot: commands.Bot):
+    """Dynamically load all command modules from the commands directory."""
+    for module_name in get_command_modules():
         try:
-            module_path = f"core.commands.{module_name}"  # Update to your package
-            module = importlib.import_module(module_path)
-            await module.setup(bot)
+            await bot.load_extension(f"{COMMANDS_PACKAGE}.{module_name}")
             logger.info(f"Loaded command module: {module_name}")
         except Exception as e:
             logger.error(f"Failed to load command module {module_name}: {e}")
+
+
+async def reload_commands(bot: commands.Bot, *module_names: str) -> List[str]:
+    """
+    Reload the given command modules (or all of them) as discord.py extensions.
+
+    Modules that are not loaded yet are loaded instead. A module that fails to
+    reload keeps its previous version running.
+
+    Returns:
+        List[str]: The names of the modules that were (re)loaded successfully.
+    """
+    reloaded = []
+    for module_name in module_names or get_command_modules():
+        extension = f"{COMMANDS_PACKAGE}.{module_name}"
+        try:
+            if extension in bot.extensions:
+                await bot.reload_extension(extension)
+            else:
+                await bot.load_extension(extension)
+            reloaded.append(module_name)
+            logger.info(f"Reloaded command module: {module_name}")
+        except Exception as e:
+            logger.error(f"Failed to reload command module {module_name}: {e}")
+    return reloaded
+
+
+def get_command_definitions(bot: commands.Bot) -> str:
+    """Serialize the global command tree, to tell whether a sync is needed."""
+    return json.dumps(
+        sorted(
+            json.dumps(command.to_dict(bot.tree), sort_keys=True, default=str)
+            for command in bot.tree.get_commands()
+        )
+    )
+
+
+async def sync_commands(bot: commands.Bot) -> None:
+    """Sync the command tree with the configured guilds."""
+    try:
+        for gid in config.get_guild_ids():
+            guild = discord.Object(id=gid)
+            # Drop stale copies so commands removed by a reload disappear too
+            bot.tree.clear_commands(guild=guild)
+            bot.tree.copy_global_to(guild=guild)
+            synced = await bot.tree.sync(guild=guild)
+            logger.info(f"Synced {len(synced)} command(s) to guild ID: {gid}")
+    except Exception as e:
+        logger.error(f"Failed to sync commands: {e}")
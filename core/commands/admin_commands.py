@@ -0,0 +1,172 @@
+import discord
+from discord.ext import commands, tasks
+from discord import app_commands
+import asyncio
+import os
+from typing import Dict, Optional
+
+from core import logger
+from core.config import config
+from core.commands import (
+    COMMANDS_DIR,
+    get_command_definitions,
+    get_command_modules,
+    reload_commands,
+    reload_lock,
+    sync_commands,
+)
+
+PROMPT_ENV_VARS = ("AI_SYSTEM_PROMPT_PATH", "AI_SUMMARY_PROMPT_PATH")
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class AdminCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._mtimes: Dict[str, Optional[float]] = {}
+        self._pending: set[asyncio.Task] = set()
+        if config.get("HOT_RELOAD_WATCH", "false").lower() in ("1", "true", "yes"):
+            self._mtimes = self._snapshot(self._watched_paths())
+            self.watch_files.change_interval(
+                seconds=float(config.get("HOT_RELOAD_INTERVAL", "2"))
+            )
+            self.watch_files.start()
+            logger.info("Watching command modules and prompt files for changes")
+
+    async def cog_unload(self) -> None:
+        # Let a running iteration finish so a reload it started is not cut short
+        self.watch_files.stop()
+
+    def _watched_paths(self) -> Dict[str, str]:
+        """Map each watched file path to its module name, or "" for prompts."""
+        paths = {
+            os.path.join(COMMANDS_DIR, f"{name}.py"): name
+            for name in get_command_modules()
+        }
+        for env_var in PROMPT_ENV_VARS:
+            path = config.get(env_var)
+            if path:
+                paths[path] = ""
+        return paths
+
+    def _snapshot(self, paths: Dict[str, str]) -> Dict[str, Optional[float]]:
+        return {path: _get_mtime(path) for path in paths}
+
+    async def reload(self, target: str = "all") -> str:
+        """
+        Reload command modules and/or prompt files.
+
+        Args:
+            target (str): "all", "prompts", or the name of a command module.
+
+        Returns:
+            str: A short human readable report.
+        """
+        report = []
+        if target != "prompts":
+            modules = get_command_modules() if target == "all" else [target]
+            reloaded, synced = await self._reload_modules(modules)
+            report.append(f"Reloaded {len(reloaded)}/{len(modules)} command module(s)")
+            if synced:
+                report.append("Synced changed commands")
+        # A reloaded AICommands cog has already read fresh prompts
+        if target in ("all", "prompts"):
+            ai_cog = self.bot.get_cog("AICommands")
+            if ai_cog is None:
+                report.append("AI commands not loaded, prompts skipped")
+            elif ai_cog.reload_prompts():
+                report.append("Reloaded prompts")
+            else:
+                report.append("Prompt reload failed, kept current prompts")
+        return ". ".join(report) + "."
+
+    @app_commands.command(
+        name="reload",
+        description="Reload command modules and prompt files without restarting",
+    )
+    @app_commands.describe(target='"all", "prompts", or a command module name')
+    @app_commands.default_permissions(administrator=True)
+    async def reload_cmd(self, interaction: discord.Interaction, target: str = "all"):
+        if target not in ("all", "prompts") and target not in get_command_modules():
+            await interaction.response.send_message(
+                f"Unknown reload target: {target}", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(thinking=True, ephemeral=True)
+        report = await self.reload(target)
+        await interaction.followup.send(report, ephemeral=True)
+        logger.info(f"{interaction.user} triggered reload of {target}: {report}")
+
+    @reload_cmd.autocomplete("target")
+    async def reload_target_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        targets = ["all", "prompts", *get_command_modules()]
+        return [
+            app_commands.Choice(name=target, value=target)
+            for target in targets
+            if current.lower() in target.lower()
+        ][:25]
+
+    @tasks.loop(seconds=2)
+    async def watch_files(self) -> None:
+        """Poll watched files and reload whatever changed since the last pass."""
+        # One map for both the snapshot and the lookup, so a module file that
+        # disappears in between cannot make the lookup fail
+        paths = self._watched_paths()
+        current = self._snapshot(paths)
+        changed = [
+            path for path, mtime in current.items() if self._mtimes.get(path) != mtime
+        ]
+        self._mtimes = current
+        if not changed:
+            return
+
+        modules = sorted({paths[path] for path in changed if paths[path]})
+        logger.info(f"Detected changes in: {', '.join(changed)}")
+
+        if len(modules) < len(changed):
+            ai_cog = self.bot.get_cog("AICommands")
+            if ai_cog is not None and "ai_commands" not in modules:
+                ai_cog.reload_prompts()
+        if modules:
+            # Reloading may unload this cog, so run it outside of the loop task
+            task = asyncio.create_task(self._reload_modules(modules))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _reload_modules(self, modules: list[str]) -> tuple[list[str], bool]:
+        """
+        Reload command modules, syncing only if command definitions changed.
+
+        Syncing is rate limited by Discord, and most edits only touch command
+        bodies, so the tree is compared before and after the reload.
+
+        Returns:
+            tuple[list[str], bool]: The reloaded modules, and whether a sync ran.
+        """
+        # Reloads from /reload and the watcher must not interleave, since
+        # unloading a cog can wait on its cleanup
+        async with reload_lock:
+            before = get_command_definitions(self.bot)
+            reloaded = await reload_commands(self.bot, *modules)
+            if get_command_definitions(self.bot) == before:
+                logger.info("Command definitions unchanged, skipping sync")
+                return reloaded, False
+            await sync_commands(self.bot)
+            return reloaded, True
+
+    @watch_files.before_loop
+    async def before_watch_files(self) -> None:
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(AdminCommands(bot))
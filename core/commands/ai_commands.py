@@ -2,13 +2,17 @@ import discord
 from datetime import datetime
 from discord.ext import commands
 from discord import app_commands
+from collections import deque
+import functools
 import json
 import os
+import time
+from typing import Deque, Dict
 
 from core import logger
-from core.apis.client import OpenRouterClient
 from core.database.schema import ChatMessage
-from core.database.handlers import add_chat_message, get_chat_history
+from core.database.conversations import conversation_store
+from core.database.settings import settings_store
 from core.config import config
 
 
@@ -31,19 +35,89 @@ def load_prompt(env_var: str) -> dict:
 class AICommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.ai_client = OpenRouterClient(api_key=config.get("OPENROUTER_API_KEY"))
-        self.system_prompt = load_prompt("AI_SYSTEM_PROMPT_PATH")
-        self.summary_prompt = load_prompt("AI_SUMMARY_PROMPT_PATH")
-        self.ai_model = config.get("AI_MODEL", "meta-llama/llama-4-scout:free")
-        self.max_tokens = int(config.get("AI_MAX_TOKENS", "250"))
+        # Small files, and reading them here lets a broken one fail the cog load
+        self.system_prompt, self.summary_prompt = self._read_prompts()
+        # Recent request times per (guild or channel, user), for rate limits
+        self._requests: Dict[tuple[int, int], Deque[float]] = {}
+
+    @functools.cached_property
+    def ai_client(self):
+        """The API client, created on first use to keep cog setup fast."""
+        # Importing the OpenAI library is slow, so defer it along with the client
+        from core.apis.client import OpenRouterClient
+
+        return OpenRouterClient(api_key=config.get("OPENROUTER_API_KEY"))
+
+    @staticmethod
+    def _read_prompts() -> tuple[dict, dict]:
+        return (
+            load_prompt("AI_SYSTEM_PROMPT_PATH"),
+            load_prompt("AI_SUMMARY_PROMPT_PATH"),
+        )
+
+    def reload_prompts(self) -> bool:
+        """
+        Re-read both prompt files and swap them in.
+
+        Both files are parsed before either prompt is replaced, so requests
+        already in flight keep the prompts they started with and a broken
+        file leaves the current prompts untouched.
+        """
+        try:
+            prompts = self._read_prompts()
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to reload prompts, keeping current ones: {e}")
+            return False
+        self.system_prompt, self.summary_prompt = prompts
+        logger.info("Reloaded AI prompts")
+        return True
+
+    def _is_rate_limited(self, interaction: discord.Interaction, limit: int) -> bool:
+        """Record a request and check it against a per-user, per-minute limit."""
+        if limit <= 0:
+            return False
+        key = (interaction.guild_id or interaction.channel_id, interaction.user.id)
+        now = time.monotonic()
+        # Forget users whose requests have all aged out, so the dict stays small
+        stale = [
+            other for other, times in self._requests.items() if times[-1] < now - 60
+        ]
+        for other in stale:
+            del self._requests[other]
+
+        requests = self._requests.setdefault(key, deque())
+        while requests and requests[0] < now - 60:
+            requests.popleft()
+        if len(requests) >= limit:
+            return True
+        requests.append(now)
+        return False
+
+    async def _reject_if_rate_limited(
+        self, interaction: discord.Interaction, limit: int
+    ) -> bool:
+        if not self._is_rate_limited(interaction, limit):
+            return False
+        await interaction.response.send_message(
+            f"Slow down, you can make {limit} AI request(s) per minute here.",
+            ephemeral=True,
+        )
+        return True
 
     @app_commands.command(name="summary")
     async def summarize_channel(self, interaction: discord.Interaction):
         """Ask Jarvis to summarize the last 200 messages."""
+        settings = settings_store.get(interaction.guild_id or interaction.channel_id)
+        if await self._reject_if_rate_limited(interaction, settings.rate_limit):
+            return
+
         await interaction.response.defer(thinking=True)
         if interaction.channel_id is not None:
             channel = self.bot.get_channel(interaction.channel_id)
-        messages = [message async for message in channel.history(limit=25)]
+        messages = [
+            message
+            async for message in channel.history(limit=settings.summary_depth)
+        ]
 
         message_history = [
             ChatMessage.create_user_message(
@@ -59,15 +133,18 @@ class AICommands(commands.Cog):
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
         current_time_message = f" The current system time is: {now}"
 
-        self.summary_prompt["content"] += current_time_message
+        summary_prompt = {
+            **self.summary_prompt,
+            "content": self.summary_prompt["content"] + current_time_message,
+        }
         # Compose the full history
-        full_history = [self.summary_prompt] + message_history
+        full_history = [summary_prompt] + message_history
 
         try:
             response = self.ai_client.get_completion(
-                model=self.ai_model,
+                model=settings.ai_model,
                 messages=full_history,
-                max_tokens=self.max_tokens,
+                max_tokens=settings.max_tokens,
             )
 
             if len(response) > 2000:
@@ -86,22 +163,30 @@ class AICommands(commands.Cog):
     @app_commands.describe(query="Your question for the AI assistant")
     async def ask_ai(self, interaction: discord.Interaction, query: str):
         """Ask the AI assistant, Javis a question"""
+        # Conversations are kept per guild, or per channel outside of one
+        conversation_id = interaction.guild_id or interaction.channel_id
+        settings = settings_store.get(conversation_id)
+        if await self._reject_if_rate_limited(interaction, settings.rate_limit):
+            return
+
         await interaction.response.defer(thinking=True)
 
         # Add user message to history
-        user_message = ChatMessage.create_user_message(query)
-        add_chat_message(user_message)
+        user_message = ChatMessage.create_user_message(query, conversation_id)
+        conversation_store.add(user_message, settings.history_window)
 
         # Get message history and prepend system prompt
-        message_history = get_chat_history()
-        full_history = [self.system_prompt] + message_history
+        message_history = conversation_store.history(
+            conversation_id, settings.history_window
+        )
+        full_history = [self.system_prompt, *message_history]
 
         # Get response from AI
         try:
             response = self.ai_client.get_completion(
-                model=self.ai_model,
+                model=settings.ai_model,
                 messages=full_history,
-                max_tokens=self.max_tokens,
+                max_tokens=settings.max_tokens,
             )
 
             # Save AI response to history
@@ -110,8 +195,9 @@ class AICommands(commands.Cog):
                     role="assistant",
                     content=response,
                     timestamp=datetime.now().timestamp(),
+                    guild_id=conversation_id,
                 )
-                add_chat_message(ai_message)
+                conversation_store.add(ai_message, settings.history_window)
 
             if len(response) > 2000:
                 response = response[:1999]
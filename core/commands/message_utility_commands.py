@@ -1,14 +1,276 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import aiohttp
+import asyncio
+import re
+import tempfile
+from typing import Dict, List, Optional
 
 from core import logger
 from core.database.handlers import set_channel_mapping, get_channel_mapping
 
+# Discord rejects webhook usernames containing these words
+_RESERVED_USERNAME_WORDS = re.compile("discord|clyde", re.IGNORECASE)
+_MAX_USERNAME_LENGTH = 80
+
+
+def _webhook_username(name: str) -> Optional[str]:
+    """Make a display name usable as a webhook username, None if nothing is left."""
+    name = " ".join(_RESERVED_USERNAME_WORDS.sub("", name).split())
+    return name[:_MAX_USERNAME_LENGTH] or None
+
+
+class ForwardingPipeline:
+    """
+    Forwards messages through per-destination queues.
+
+    Each destination channel gets its own worker that sends through a cached
+    webhook, so forwarded messages keep the original author's name and
+    avatar. Messages queued in a burst are coalesced into multi-embed
+    messages, and attachments are streamed through a spooled temporary file
+    rather than read whole into memory.
+    """
+
+    WEBHOOK_NAME = "Axiom Forwarding"
+    MAX_WEBHOOKS_ERROR = 30007  # The channel already has the maximum webhooks
+    BATCH_DELAY = 0.5  # Seconds to wait for a burst to build up
+    MAX_EMBEDS = 10
+    MAX_EMBED_CHARS = 6000
+    MAX_FILES = 10
+    SPOOL_SIZE = 1024 * 1024  # Attachments larger than this spill to disk
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._queues: Dict[int, asyncio.Queue[discord.Message]] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._webhooks: Dict[int, Optional[discord.Webhook]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def enqueue(self, channel: discord.TextChannel, message: discord.Message) -> None:
+        """Queue a message to be forwarded to the given channel."""
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = asyncio.Queue()
+            self._workers[channel.id] = asyncio.create_task(
+                self._worker(channel, queue)
+            )
+        queue.put_nowait(message)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Wait for queued messages to be sent, then stop the workers."""
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues.values())),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Timed out flushing forward queues, dropping the rest")
+        for task in self._workers.values():
+            task.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+
+    async def _worker(
+        self, channel: discord.TextChannel, queue: asyncio.Queue[discord.Message]
+    ) -> None:
+        carry: Optional[discord.Message] = None
+        while True:
+            message = carry or await queue.get()
+            carry = None
+            if queue.empty():
+                await asyncio.sleep(self.BATCH_DELAY)
+
+            batch = [message]
+            embeds = self._build_embeds(message, channel)
+            embed_chars = sum(len(embed) for embed in embeds)
+            files = len(message.attachments)
+            while not queue.empty():
+                candidate = queue.get_nowait()
+                candidate_embeds = self._build_embeds(candidate, channel)
+                candidate_chars = sum(len(embed) for embed in candidate_embeds)
+                if (
+                    len(embeds) + len(candidate_embeds) > self.MAX_EMBEDS
+                    or embed_chars + candidate_chars > self.MAX_EMBED_CHARS
+                    or files + len(candidate.attachments) > self.MAX_FILES
+                ):
+                    carry = candidate
+                    break
+                batch.append(candidate)
+                embeds.extend(candidate_embeds)
+                embed_chars += candidate_chars
+                files += len(candidate.attachments)
+
+            try:
+                await self._send(channel, batch, embeds)
+                logger.info(
+                    f"Forwarded {len(batch)} message(s) to channel {channel.id}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to forward messages to {channel.id}: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _build_embeds(
+        self, message: discord.Message, channel: discord.TextChannel
+    ) -> List[discord.Embed]:
+        """
+        Quote a message as an embed, followed by the embeds it carried.
+
+        Carried embeds that would push the total past what one Discord
+        message can hold are left out.
+        """
+        quote = discord.Embed(
+            description=message.content or None,
+            timestamp=message.created_at,
+        )
+        quote.set_author(
+            name=message.author.display_name,
+            icon_url=message.author.display_avatar.url,
+            url=message.jump_url,
+        )
+        quote.set_footer(text=f"#{message.channel}")
+        too_large = [
+            attachment
+            for attachment in message.attachments
+            if attachment.size > channel.guild.filesize_limit
+        ]
+        if too_large:
+            quote.add_field(
+                name="Attachments",
+                value="\n".join(
+                    f"[{attachment.filename}]({attachment.url})"
+                    for attachment in too_large
+                )[:1024],
+            )
+        embeds = [quote]
+        embed_chars = len(quote)
+        for embed in message.embeds[: self.MAX_EMBEDS - 1]:
+            if embed_chars + len(embed) > self.MAX_EMBED_CHARS:
+                continue
+            embeds.append(embed)
+            embed_chars += len(embed)
+        return embeds
+
+    async def _send(
+        self,
+        channel: discord.TextChannel,
+        batch: List[discord.Message],
+        embeds: List[discord.Embed],
+    ) -> None:
+        authors = {message.author for message in batch}
+        author = batch[0].author if len(authors) == 1 else None
+        username = _webhook_username(author.display_name) if author else None
+        attachments = [
+            attachment
+            for message in batch
+            for attachment in message.attachments
+            if attachment.size <= channel.guild.filesize_limit
+        ]
+
+        # A cached webhook may have been deleted since, so retry once
+        for attempt in range(2):
+            webhook = await self._get_webhook(channel)
+            files = await self._download_files(attachments)
+            try:
+                if webhook is None:
+                    await channel.send(
+                        embeds=embeds,
+                        files=files,
+                        allowed_mentions=discord.AllowedMentions.none(),
+                    )
+                else:
+                    # Keep the author's identity when the batch has only one
+                    identity = (
+                        {
+                            "username": username,
+                            "avatar_url": author.display_avatar.url,
+                        }
+                        if username
+                        else {}
+                    )
+                    await webhook.send(
+                        embeds=embeds,
+                        files=files,
+                        allowed_mentions=discord.AllowedMentions.none(),
+                        **identity,
+                    )
+                return
+            except discord.NotFound:
+                if webhook is None or attempt:
+                    raise
+                logger.warning(f"Forwarding webhook for {channel.id} is gone")
+                self._webhooks.pop(channel.id, None)
+            finally:
+                # discord.File does not close file objects it was handed
+                for file in files:
+                    file.fp.close()
+
+    async def _get_webhook(
+        self, channel: discord.TextChannel
+    ) -> Optional[discord.Webhook]:
+        """Get or create the bot's webhook for a channel, None if not allowed."""
+        if channel.id in self._webhooks:
+            return self._webhooks[channel.id]
+
+        try:
+            for hook in await channel.webhooks():
+                if hook.user == self.bot.user and hook.token:
+                    webhook = hook
+                    break
+            else:
+                webhook = await channel.create_webhook(name=self.WEBHOOK_NAME)
+        except discord.HTTPException as e:
+            logger.warning(
+                f"Cannot use a webhook in channel {channel.id}, sending as the bot: {e}"
+            )
+            # Only remember failures that will not go away on their own
+            if isinstance(e, discord.Forbidden) or e.code == self.MAX_WEBHOOKS_ERROR:
+                self._webhooks[channel.id] = None
+            return None
+        self._webhooks[channel.id] = webhook
+        return webhook
+
+    async def _download_files(
+        self, attachments: List[discord.Attachment]
+    ) -> List[discord.File]:
+        files = []
+        for attachment in attachments:
+            try:
+                files.append(await self._download(attachment))
+            except Exception as e:
+                logger.error(f"Failed to download attachment {attachment.id}: {e}")
+        return files
+
+    async def _download(self, attachment: discord.Attachment) -> discord.File:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE)
+        try:
+            async with self._session.get(attachment.url) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                    buffer.write(chunk)
+        except BaseException:
+            buffer.close()
+            raise
+        buffer.seek(0)
+        return discord.File(
+            buffer, filename=attachment.filename, spoiler=attachment.is_spoiler()
+        )
+
 
 class MessageUtilityCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.forwarding = ForwardingPipeline(bot)
+
+    async def cog_unload(self) -> None:
+        await self.forwarding.close()
 
     @app_commands.command(
         name="set_forward_channel",
@@ -79,11 +341,11 @@ async def forward_message(interaction: discord.Interaction, message: discord.Mes
         )
         return
 
-    await interaction.response.send_message(f"Forwarded to {channel.mention}")
-    await channel.send(
-        f"**Forwarded message from {message.author.mention}:**\n{message.content}"
+    cog.forwarding.enqueue(channel, message)
+    await interaction.response.send_message(
+        f"Queued for forwarding to {channel.mention}"
     )
-    logger.info(f"Forwarded message {message.id} to channel {channel.id}")
+    logger.info(f"Queued message {message.id} for forwarding to channel {channel.id}")
 
 
 # --- Setup function ---
@@ -0,0 +1,114 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from typing import Optional
+
+from core import logger
+from core.database.settings import SETTING_NAMES, ResolvedSettings, settings_store
+
+
+def _format_settings(settings: ResolvedSettings, overridden: set[str]) -> str:
+    lines = []
+    for name in SETTING_NAMES:
+        marker = "" if name in overridden else " (default)"
+        lines.append(f"**{name}**: `{getattr(settings, name)}`{marker}")
+    return "\n".join(lines)
+
+
+class SettingsCommands(commands.Cog):
+    settings = app_commands.Group(
+        name="settings",
+        description="View and tune the bot's settings for this server",
+        guild_only=True,
+        default_permissions=discord.Permissions(administrator=True),
+    )
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    def _overridden(self, guild_id: int) -> set[str]:
+        overrides = settings_store.get_overrides(guild_id)
+        return {
+            name for name in SETTING_NAMES if getattr(overrides, name) is not None
+        }
+
+    @settings.command(name="show", description="Show the settings for this server")
+    async def show_settings(self, interaction: discord.Interaction):
+        settings = settings_store.get(interaction.guild_id)
+        await interaction.response.send_message(
+            _format_settings(settings, self._overridden(interaction.guild_id)),
+            ephemeral=True,
+        )
+
+    @settings.command(name="set", description="Override settings for this server")
+    @app_commands.describe(
+        ai_model="Model used for AI commands",
+        max_tokens="Maximum tokens per AI response",
+        history_window="Seconds of /ask history sent with each question",
+        summary_depth="Number of messages /summary reads",
+        rate_limit="AI requests per user per minute, 0 for no limit",
+    )
+    async def set_settings(
+        self,
+        interaction: discord.Interaction,
+        ai_model: Optional[str] = None,
+        max_tokens: Optional[app_commands.Range[int, 1, 4000]] = None,
+        history_window: Optional[app_commands.Range[int, 60, 86400]] = None,
+        summary_depth: Optional[app_commands.Range[int, 1, 200]] = None,
+        rate_limit: Optional[app_commands.Range[int, 0, 60]] = None,
+    ):
+        changes = {
+            name: value
+            for name, value in (
+                ("ai_model", ai_model),
+                ("max_tokens", max_tokens),
+                ("history_window", history_window),
+                ("summary_depth", summary_depth),
+                ("rate_limit", rate_limit),
+            )
+            if value is not None
+        }
+        if not changes:
+            await interaction.response.send_message(
+                "Nothing to change, pass at least one setting.", ephemeral=True
+            )
+            return
+
+        settings = settings_store.update(interaction.guild_id, **changes)
+        await interaction.response.send_message(
+            _format_settings(settings, self._overridden(interaction.guild_id)),
+            ephemeral=True,
+        )
+        logger.info(
+            f"{interaction.user} changed settings in guild {interaction.guild_id}: "
+            f"{changes}"
+        )
+
+    @settings.command(
+        name="reset", description="Reset a setting, or all of them, to the default"
+    )
+    @app_commands.describe(setting="The setting to reset, all of them if omitted")
+    @app_commands.choices(
+        setting=[app_commands.Choice(name=name, value=name) for name in SETTING_NAMES]
+    )
+    async def reset_settings(
+        self,
+        interaction: discord.Interaction,
+        setting: Optional[app_commands.Choice[str]] = None,
+    ):
+        names = [setting.value] if setting else SETTING_NAMES
+        settings = settings_store.update(
+            interaction.guild_id, **{name: None for name in names}
+        )
+        await interaction.response.send_message(
+            _format_settings(settings, self._overridden(interaction.guild_id)),
+            ephemeral=True,
+        )
+        logger.info(
+            f"{interaction.user} reset {', '.join(names)} "
+            f"in guild {interaction.guild_id}"
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(SettingsCommands(bot))
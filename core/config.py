@@ -48,8 +48,8 @@ class Config:
         return self._config
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
-        """Get a configuration value."""
-        return self._config.get(key, default)
+        """Get a configuration value, falling back to the environment."""
+        return self._config.get(key, os.getenv(key, default))
 
     def get_guild_ids(self) -> List[int]:
         """Get guild IDs as integers."""
@@ -0,0 +1,149 @@
+import sys
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from core import logger
+from core.config import config
+from core.database.schema import ChatMessage
+from core.database.handlers import (
+    add_chat_message,
+    get_chat_history,
+    remove_chat_messages,
+)
+
+# Rough cost of one cached message besides its content: the slotted record,
+# its API message dict and the slots both containers hold for it.
+_MESSAGE_OVERHEAD = (
+    sys.getsizeof(ChatMessage("", "", 0.0))
+    + sys.getsizeof({"role": "", "content": ""})
+    + 2 * 8
+)
+
+
+def _message_size(message: ChatMessage) -> int:
+    return sys.getsizeof(message.content) + _MESSAGE_OVERHEAD
+
+
+class Conversation:
+    """A bounded, in-order buffer of the recent messages of one guild."""
+
+    __slots__ = ("records", "messages", "nbytes")
+
+    def __init__(self):
+        self.records: Deque[ChatMessage] = deque()
+        # Kept in step with ``records`` so it can be handed to the API as is
+        self.messages: List[Dict[str, str]] = []
+        self.nbytes = 0
+
+    def append(self, message: ChatMessage) -> None:
+        self.records.append(message)
+        self.messages.append({"role": message.role, "content": message.content})
+        self.nbytes += _message_size(message)
+
+    def popleft(self) -> ChatMessage:
+        message = self.records.popleft()
+        del self.messages[0]
+        self.nbytes -= _message_size(message)
+        return message
+
+
+class ConversationStore:
+    """
+    In-memory cache of per-guild chat history in front of the database.
+
+    Messages are written through to the database, so evicting a conversation
+    only drops it from memory; it is read back on the next access. The least
+    recently used conversations are evicted once the cache grows past its
+    byte budget.
+    """
+
+    def __init__(self, max_bytes: int, max_messages: int, max_age: float = 3600):
+        """
+        Args:
+            max_bytes (int): Approximate memory budget for all conversations.
+            max_messages (int): Messages kept per conversation.
+            max_age (float, optional): Seconds before a message expires.
+                                       Defaults to 3600.
+        """
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self.nbytes = 0
+        self._conversations: OrderedDict[int, Conversation] = OrderedDict()
+
+    def add(self, message: ChatMessage, max_age: Optional[float] = None) -> None:
+        """
+        Persist a message and append it to its guild's conversation.
+
+        Args:
+            message (ChatMessage): The message, with its guild_id set.
+            max_age (Optional[float], optional): Seconds before messages of
+                                                 this guild expire. Defaults
+                                                 to the store's max_age.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        # Load the conversation before persisting, so it is not read back twice
+        conversation = self._get(message.guild_id, max_age)
+        add_chat_message(message)
+        conversation.append(message)
+        self.nbytes += _message_size(message)
+        self._trim(conversation, max_age)
+        self._evict()
+
+    def history(
+        self, guild_id: int, max_age: Optional[float] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Get the recent messages of a guild in the format the API expects.
+
+        The returned list is shared with the cache and must not be mutated.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        conversation = self._get(guild_id, max_age)
+        self._trim(conversation, max_age)
+        return conversation.messages
+
+    def _get(self, guild_id: int, max_age: float) -> Conversation:
+        conversation = self._conversations.get(guild_id)
+        if conversation is not None:
+            self._conversations.move_to_end(guild_id)
+            return conversation
+
+        conversation = Conversation()
+        for message in get_chat_history(guild_id, max_age):
+            conversation.append(message)
+        self.nbytes += conversation.nbytes
+        self._conversations[guild_id] = conversation
+        logger.debug(
+            f"Loaded {len(conversation.records)} messages for guild {guild_id}"
+        )
+        return conversation
+
+    def _trim(self, conversation: Conversation, max_age: float) -> None:
+        """Drop expired messages and those past the per-conversation limit."""
+        cutoff = datetime.now().timestamp() - max_age
+        expired = []
+        while conversation.records and (
+            len(conversation.records) > self.max_messages
+            or conversation.records[0].timestamp < cutoff
+        ):
+            message = conversation.popleft()
+            self.nbytes -= _message_size(message)
+            if message.doc_id is not None:
+                expired.append(message.doc_id)
+        if expired:
+            remove_chat_messages(expired)
+
+    def _evict(self) -> None:
+        """Evict cold conversations until the cache fits its budget."""
+        while self.nbytes > self.max_bytes and len(self._conversations) > 1:
+            guild_id, conversation = self._conversations.popitem(last=False)
+            self.nbytes -= conversation.nbytes
+            logger.debug(f"Evicted conversation for guild {guild_id}")
+
+
+conversation_store = ConversationStore(
+    max_bytes=int(config.get("CONVERSATION_CACHE_BYTES", str(8 * 1024 * 1024))),
+    max_messages=int(config.get("CONVERSATION_MAX_MESSAGES", "100")),
+)
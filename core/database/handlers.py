@@ -1,48 +1,100 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 from tinydb import TinyDB, Query
+from tinydb.table import Table
 from datetime import datetime
+import functools
 
 from core import logger
-from core.database.schema import ChannelMapping, ChatMessage
+from core.database.schema import ChannelMapping, ChatMessage, GuildSettings
 from core.config import config
 
-# Get DB path from config (which loads from .env)
-DB_PATH = config.get("DB_PATH", "bot_db.json")
-db = TinyDB(DB_PATH)
-channel_mappings_table = db.table("channel_mappings")
-chat_messages_table = db.table("chat_messages")
+
+@functools.cache
+def get_db() -> TinyDB:
+    """Open the database on first use, so startup does not parse the file."""
+    # Get DB path from config (which loads from .env)
+    db_path = config.get("DB_PATH", "bot_db.json")
+    db = TinyDB(db_path)
+    logger.info(f"Opened database: {db_path}")
+    return db
+
+
+def channel_mappings_table() -> Table:
+    return get_db().table("channel_mappings")
+
+
+def chat_messages_table() -> Table:
+    return get_db().table("chat_messages")
+
+
+def guild_settings_table() -> Table:
+    return get_db().table("guild_settings")
 
 
 def set_channel_mapping(guild_id: int, channel_id: int) -> None:
     Guild = Query()
     channel_mapping = ChannelMapping(guild_id=guild_id, channel_id=channel_id)
-    channel_mappings_table.upsert(channel_mapping.to_dict(), Guild.guild_id == guild_id)
+    channel_mappings_table().upsert(
+        channel_mapping.to_dict(), Guild.guild_id == guild_id
+    )
     logger.info(f"Set mapping channel {channel_id} for guild {guild_id}")
 
 
 def get_channel_mapping(guild_id: int) -> Optional[ChannelMapping]:
     Guild = Query()
-    result = channel_mappings_table.search(Guild.guild_id == guild_id)
+    result = channel_mappings_table().search(Guild.guild_id == guild_id)
     if not result:
         return None
     return ChannelMapping.from_dict(result[0])
 
 
 def add_chat_message(message: ChatMessage) -> int:
-    doc_id = chat_messages_table.insert(message.to_dict())
+    doc_id = chat_messages_table().insert(message.to_dict())
+    message.doc_id = doc_id
     logger.debug(f"Added message to chat history: {message.content[:50]}...")
     return doc_id
 
 
-def get_chat_history() -> List[Dict[str, Any]]:
-    messages = chat_messages_table.all()
-    current_time = datetime.now().timestamp()
-    to_remove = []
-    for message in messages:
-        if message["timestamp"] < current_time - 3600:
-            to_remove.append(message.doc_id)
-    if to_remove:
-        chat_messages_table.remove(doc_ids=to_remove)
-        logger.debug(f"Cleaned up {len(to_remove)} old chat messages")
-        messages = chat_messages_table.all()
-    return messages
+def remove_chat_messages(doc_ids: List[int]) -> None:
+    # Skip repeated or already removed IDs, TinyDB raises KeyError for them.
+    # Each table read parses the whole file, so check them all in one read.
+    table = chat_messages_table()
+    existing = {doc.doc_id for doc in table.all()}
+    doc_ids = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id in existing]
+    if not doc_ids:
+        return
+    table.remove(doc_ids=doc_ids)
+    logger.debug(f"Removed {len(doc_ids)} chat messages")
+
+
+def get_chat_history(guild_id: int, max_age: float = 3600) -> List[ChatMessage]:
+    Message = Query()
+    cutoff = datetime.now().timestamp() - max_age
+    # Only expire this guild's messages (and any left over from before history
+    # was kept per guild); other guilds may still hold theirs in memory
+    removed = chat_messages_table().remove(
+        (Message.timestamp < cutoff)
+        & ((Message.guild_id == guild_id) | ~Message.guild_id.exists())
+    )
+    if removed:
+        logger.debug(f"Cleaned up {len(removed)} old chat messages")
+    return [
+        ChatMessage.from_dict(doc, doc_id=doc.doc_id)
+        for doc in chat_messages_table().search(Message.guild_id == guild_id)
+    ]
+
+
+def set_guild_settings(settings: GuildSettings) -> None:
+    Guild = Query()
+    guild_settings_table().upsert(
+        settings.to_dict(), Guild.guild_id == settings.guild_id
+    )
+    logger.info(f"Updated settings for guild {settings.guild_id}")
+
+
+def get_guild_settings(guild_id: int) -> Optional[GuildSettings]:
+    Guild = Query()
+    result = guild_settings_table().search(Guild.guild_id == guild_id)
+    if not result:
+        return None
+    return GuildSettings.from_dict(result[0])
@@ -16,15 +16,21 @@ class ChannelMapping:
         return cls(guild_id=data["guild_id"], channel_id=data["channel_id"])
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     role: str
     content: str
     timestamp: float
     doc_id: Optional[int] = None
+    guild_id: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {"role": self.role, "content": self.content, "timestamp": self.timestamp}
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "guild_id": self.guild_id,
+        }
 
     @classmethod
     def from_dict(
@@ -35,8 +41,49 @@ class ChatMessage:
             content=data["content"],
             timestamp=data["timestamp"],
             doc_id=doc_id,
+            guild_id=data.get("guild_id"),
         )
 
     @classmethod
-    def create_user_message(cls, content: str) -> "ChatMessage":
-        return cls(role="user", content=content, timestamp=datetime.now().timestamp())
+    def create_user_message(
+        cls, content: str, guild_id: Optional[int] = None
+    ) -> "ChatMessage":
+        return cls(
+            role="user",
+            content=content,
+            timestamp=datetime.now().timestamp(),
+            guild_id=guild_id,
+        )
+
+
+@dataclass
+class GuildSettings:
+    """Per-guild overrides, None means the global default applies."""
+
+    guild_id: int
+    ai_model: Optional[str] = None
+    max_tokens: Optional[int] = None
+    history_window: Optional[int] = None
+    summary_depth: Optional[int] = None
+    rate_limit: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "guild_id": self.guild_id,
+            "ai_model": self.ai_model,
+            "max_tokens": self.max_tokens,
+            "history_window": self.history_window,
+            "summary_depth": self.summary_depth,
+            "rate_limit": self.rate_limit,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GuildSettings":
+        return cls(
+            guild_id=data["guild_id"],
+            ai_model=data.get("ai_model"),
+            max_tokens=data.get("max_tokens"),
+            history_window=data.get("history_window"),
+            summary_depth=data.get("summary_depth"),
+            rate_limit=data.get("rate_limit"),
+        )
@@ -0,0 +1,98 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from core import logger
+from core.config import config
+from core.database.schema import GuildSettings
+from core.database.handlers import get_guild_settings, set_guild_settings
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedSettings:
+    """The settings in effect for a guild, with defaults filled in."""
+
+    ai_model: str
+    max_tokens: int
+    history_window: int
+    summary_depth: int
+    rate_limit: int  # AI requests per user per minute, 0 for no limit
+
+
+SETTING_NAMES = tuple(field.name for field in dataclasses.fields(ResolvedSettings))
+
+
+class SettingsStore:
+    """
+    Cached, typed access to per-guild settings.
+
+    A guild's settings are read from the database once and kept resolved in
+    memory; writes go through the store, which replaces the cached entry, so
+    reading settings never touches the database after the first time.
+    """
+
+    def __init__(self):
+        self._defaults: Optional[ResolvedSettings] = None
+        self._cache: Dict[int, ResolvedSettings] = {}
+
+    @property
+    def defaults(self) -> ResolvedSettings:
+        """The global defaults, read from the environment on first use."""
+        if self._defaults is None:
+            self._defaults = ResolvedSettings(
+                ai_model=config.get("AI_MODEL", "meta-llama/llama-4-scout:free"),
+                max_tokens=int(config.get("AI_MAX_TOKENS", "250")),
+                history_window=int(config.get("AI_HISTORY_WINDOW", "3600")),
+                summary_depth=int(config.get("AI_SUMMARY_DEPTH", "25")),
+                rate_limit=int(config.get("AI_RATE_LIMIT", "0")),
+            )
+        return self._defaults
+
+    def get(self, guild_id: int) -> ResolvedSettings:
+        """Get the settings in effect for a guild."""
+        settings = self._cache.get(guild_id)
+        if settings is None:
+            settings = self._resolve(get_guild_settings(guild_id))
+            self._cache[guild_id] = settings
+        return settings
+
+    def get_overrides(self, guild_id: int) -> GuildSettings:
+        """Get the values a guild has overridden, None where it has not."""
+        return get_guild_settings(guild_id) or GuildSettings(guild_id=guild_id)
+
+    def update(self, guild_id: int, **changes: Any) -> ResolvedSettings:
+        """
+        Override settings for a guild and refresh its cached entry.
+
+        Args:
+            guild_id (int): The guild to update.
+            **changes: Setting names mapped to their new values. A value of
+                       None resets the setting to the global default.
+
+        Returns:
+            ResolvedSettings: The settings now in effect for the guild.
+        """
+        unknown = set(changes) - set(SETTING_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown settings: {', '.join(sorted(unknown))}")
+
+        overrides = dataclasses.replace(self.get_overrides(guild_id), **changes)
+        set_guild_settings(overrides)
+        settings = self._cache[guild_id] = self._resolve(overrides)
+        logger.info(f"Settings for guild {guild_id} are now {settings}")
+        return settings
+
+    def _resolve(self, overrides: Optional[GuildSettings]) -> ResolvedSettings:
+        if overrides is None:
+            return self.defaults
+        return dataclasses.replace(
+            self.defaults,
+            **{
+                name: getattr(overrides, name)
+                for name in SETTING_NAMES
+                if getattr(overrides, name) is not None
+            },
+        )
+
+
+settings_store = SettingsStore()
@@ -0,0 +1,51 @@
+import os
+import time
+from typing import List, Tuple
+
+from core import logger
+
+
+def _process_age() -> float:
+    """Seconds since the process was started, or 0.0 if it cannot be told."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # The command name may contain spaces, so split after its ")"
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, IndexError, ValueError):
+        return 0.0
+    start_ticks = int(fields[19])  # starttime, field 22 of /proc/<pid>/stat
+    return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+
+
+class StartupTimer:
+    """Records how long each startup phase takes, from process start to READY."""
+
+    def __init__(self):
+        now = time.perf_counter()
+        self._start = now - _process_age()
+        self._last = self._start
+        self._phases: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, phase: str) -> None:
+        """Mark the end of a startup phase."""
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last))
+        self._last = now
+        logger.debug(f"Startup phase '{phase}' finished in {self._phases[-1][1]:.3f}s")
+
+    def report(self) -> None:
+        """Log the time spent in each phase and in total, once."""
+        if self.reported:
+            return
+        self.reported = True
+        breakdown = ", ".join(f"{phase} {took:.3f}s" for phase, took in self._phases)
+        logger.info(
+            f"Ready {self._last - self._start:.3f}s after process start ({breakdown})"
+        )
+
+
+# The first phase also covers interpreter startup and the imports before this
+startup_timer = StartupTimer()
@@ -1,5 +1,7 @@
+from core.startup import startup_timer
 from core.bot import DiscordBot
 
 if __name__ == "__main__":
+    startup_timer.mark("imports")
     bot = DiscordBot()
     bot.run()